@@ -3,4 +3,4 @@
 # Import KVstores
 from pykvstores.lmdb_kvstore import LMDBKVStore
 from pykvstores.ray_kvstore import RayKVStore
-from pykvstores.pyarrow_plasma_kvstore import PyArrowPlasmaKVStore
+from pykvstores.pyarrow_plasma_kvstore import KeyView, PyArrowPlasmaKVStore
@@ -2,12 +2,139 @@
 
 import functools
 import os
+import pickle
+import struct
 import subprocess
+import threading
 import time
-from hashlib import blake2b
+import weakref
+import msgspec
+import pyarrow as pa
+import zstd
+from blake3 import blake3
 from humanfriendly import format_size
 from pyarrow import plasma
 
+# Maximum time (in seconds) to wait for the plasma store to accept connections
+_STARTUP_TIMEOUT = 10.0
+
+# Keys longer than this (in bytes or characters) are not kept in the object ID cache
+_MAX_CACHED_KEY_SIZE = 256
+
+# Alignment (in bytes) of the serialized segments in the plasma objects
+_ALIGNMENT = 64
+
+# Header of the serialized values: flags (uint8) and number of segments (uint32)
+_HEADER = struct.Struct("<BI")
+
+# Header flags
+_FLAG_MSGPACK = 1
+_FLAG_ZSTD = 2
+
+# First byte of the key metadata, the serializer of the key
+_KEY_MSGPACK = 0
+_KEY_PICKLE = 1
+
+# Key type -> bytes encoder used before hashing
+_KEY_ENCODERS = {
+    str: str.encode,
+    bytes: lambda key: key,
+    int: lambda key: key.to_bytes(
+        (key.bit_length() + 8) // 8, "little", signed=True
+    ),
+}
+
+
+def _gen_hash(key, digest_size=20):
+    """Generate the BLAKE3 hash digest of a key (see PyArrowPlasmaKVStore.gen_hash)"""
+    # Single dict lookup on the exact type instead of a chain of isinstance checks
+    try:
+        encode = _KEY_ENCODERS[type(key)]
+    except KeyError:
+        encode = _find_key_encoder(type(key))
+
+    return blake3(encode(key)).digest(length=digest_size)
+
+
+def _find_key_encoder(key_type):
+    """Find the encoder of a subclass of a supported key type (e.g., bool, IntEnum)
+
+    Args:
+      key_type: Type of the key
+
+    Returns: Bytes encoder of the key type
+
+    """
+    for base in key_type.__mro__[1:]:
+        if base in _KEY_ENCODERS:
+            # Register the subclass so that its next lookups take the fast path
+            _KEY_ENCODERS[key_type] = _KEY_ENCODERS[base]
+            return _KEY_ENCODERS[base]
+
+    raise TypeError(
+        f"Unsupported key type: {key_type.__name__} (type: string, bytes, or int)"
+    )
+
+
+def _segment_offsets(sizes):
+    """Offsets of consecutive segments of the given sizes (aligned to _ALIGNMENT bytes)"""
+    offsets = []
+    offset = 0
+    for size in sizes:
+        offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+        offsets.append(offset)
+        offset += size
+    return offsets
+
+
+# The object ID only depends on the key, so cached IDs never go stale (even after deletes)
+@functools.lru_cache(maxsize=65536, typed=True)
+def _cached_object_id(key):
+    """Generate the object ID of a short key, caching it (see _gen_object_id)"""
+    return plasma.ObjectID(_gen_hash(key))
+
+
+def _gen_object_id(key):
+    """Generate the object ID of a key from its 20 bytes hash digest
+
+    Only keys up to _MAX_CACHED_KEY_SIZE bytes (or characters) are cached, as the cache \
+        holds a reference to every cached key and long keys would be pinned in memory.
+
+    Args:
+      key: Key (type: string, bytes, or int)
+
+    Returns: Object ID
+
+    """
+    if isinstance(key, (str, bytes)):
+        cacheable = len(key) <= _MAX_CACHED_KEY_SIZE
+    elif isinstance(key, int):
+        cacheable = key.bit_length() <= 8 * _MAX_CACHED_KEY_SIZE
+    else:
+        # Unsupported key types raise a TypeError in _gen_hash
+        cacheable = False
+
+    if cacheable:
+        return _cached_object_id(key)
+
+    return plasma.ObjectID(_gen_hash(key))
+
+
+def _release_client(client, idle_clients):
+    """Return the plasma client of an exited thread to the idle clients pool
+
+    The client stays connected, so that the zero-copy values read through it remain valid, \
+        and is reused by the next thread needing a client.
+
+    Args:
+      client: Plasma client of the exited thread
+      idle_clients: Idle clients pool of the store
+
+    """
+    # No lock is taken as finalizers can run while the current thread holds it,
+    # list.append is atomic
+    idle_clients.append(client)
+
 
 # Decorators
 def check_connected(func):
@@ -25,6 +152,38 @@ def check_connected(func):
     return wrapper
 
 
+class KeyView:
+    """Key wrapper holding the precomputed object ID of the key
+
+    Args:
+      key: Key (type: string, bytes, or int)
+
+    Notes:
+      1. The key is hashed once when the KeyView is created, reuse the KeyView across \
+          get/set/contains/delete calls on hot keys to skip hashing the key on every call
+      2. Accepted by PyArrowPlasmaKVStore wherever a key is expected
+      3. Compares and hashes equal to the wrapped key
+
+    """
+
+    __slots__ = ("key", "object_id")
+
+    def __init__(self, key):
+        self.key = key
+        self.object_id = _gen_object_id(key)
+
+    def __repr__(self):
+        return f"KeyView({self.key!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, KeyView):
+            other = other.key
+        return self.key == other
+
+    def __hash__(self):
+        return hash(self.key)
+
+
 class PyArrowPlasmaKVStore:
     """Key-value store using Pyarrow's plasma object store as its backend
 
@@ -40,9 +199,14 @@ class PyArrowPlasmaKVStore:
       name: Name of the plasma object store socket file (default: pykvstores_plasma_store_socket)
       size: Size of the plasma object store in bytes (default: 70% of the available shared memory)
       create: Create the plasma object store and the socket file (default: True)
+      msgpack_values: Serialize values using msgspec.msgpack instead of pickle whenever \
+          msgpack supports them (default: False)
+      compression_threshold: Serialized values larger than this size in bytes are compressed \
+          using zstd, None disables the compression (default: 65536)
+      compression_level: zstd compression level (default: 1)
 
     Notes:
-      1. Keys are hashed using BLAKE2 algorithm and the resulting 20 bytes hash digest is used as \
+      1. Keys are hashed using BLAKE3 algorithm and the resulting 20 bytes hash digest is used as \
           the ObjectID
       2. If the socket file already exists, it is deleted and a new socket file is created for the \
           new instance
@@ -52,11 +216,36 @@ class PyArrowPlasmaKVStore:
           no longer needed
       5. Safe to read/write in multiple processes
       6. Only one instance of the plasma object store can be created per socket file
+      7. Values are serialized using pickle (protocol 5) and stored as the object's data, \
+          keys are serialized using msgspec.msgpack (pickle for keys msgpack does not support, \
+          e.g., ints outside the 64 bit range) and stored as the object's metadata. \
+          Keys can therefore be listed without reading the values
+      8. msgpack_values speeds up the serialization of dict/list/scalar values, but follows \
+          msgpack semantics (e.g., tuples are returned as lists). Values not supported by \
+          msgpack (e.g., NumPy arrays) are still serialized using pickle
+      9. Only the serialized payload is compressed, out-of-band buffers (e.g., NumPy arrays) \
+          are always stored uncompressed to keep them zero-copy
+      10. Contiguous buffers (e.g., NumPy arrays) are written to and read from the shared \
+          memory without intermediate copies, the returned arrays are read-only
+      11. Keys can be wrapped in a KeyView to hash them only once
+      12. Each thread uses its own plasma client, connected on its first use, so that \
+          threads do not contend on a single client. The client of an exited thread stays \
+          connected (the zero-copy values read through it are only kept alive in the shared \
+          memory by the client) and is reused by the next new thread, so the number of \
+          clients is capped by the peak number of concurrent threads. disconnect() \
+          disconnects all the clients
 
     """
 
     def __init__(
-        self, path, name="pykvstores_plasma_store_socket", size=None, create=True
+        self,
+        path,
+        name="pykvstores_plasma_store_socket",
+        size=None,
+        create=True,
+        msgpack_values=False,
+        compression_threshold=65536,
+        compression_level=1,
     ):
         # Set the socket path. If path does not exist create it
         self.socket_path = os.path.join(path, name)
@@ -64,11 +253,23 @@ class PyArrowPlasmaKVStore:
             os.makedirs(path)
 
         self.size = self.__check_size(size)
+        self.msgpack_values = msgpack_values
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
         self.__created = False
         self.plasma_store_proc = None
-        self.client = None
+        self._local = threading.local()
+        self._clients = []
+        self._idle_clients = []
+        self._clients_lock = threading.Lock()
+        # Incremented by disconnect() to detect clients connected concurrently
+        self._generation = 0
         self._connected = False
 
+        # Key (and msgpack_values) serializer and deserializer initialization
+        self.encoder = msgspec.msgpack.Encoder()
+        self.decoder = msgspec.msgpack.Decoder()
+
         # Create the plasma object store
         if create:
             self.create_plasma_store()
@@ -80,15 +281,19 @@ class PyArrowPlasmaKVStore:
         Args:
           key: Key (type: string, bytes, or int). The key, value pair is \
               ignored if the key already exists.
-          value: Value (Any python object)
+          value: Value (Any picklable python object)
 
         """
         # Generate an object ID
         object_id = self.gen_object_id(key)
 
+        # Existing keys are ignored, skip serializing their values
+        if self.client.contains(object_id):
+            return
+
         # Set the key-value pair in the plasma object store
         try:
-            self.client.put([key, value], object_id)
+            self._put(object_id, key, value)
         except plasma.PlasmaObjectExists:
             pass
         except plasma.PlasmaStoreFull:
@@ -109,9 +314,11 @@ class PyArrowPlasmaKVStore:
         # Generate an object ID
         object_id = self.gen_object_id(key)
 
-        # Get the value from the plasma object store
-        if self.client.contains(object_id):
-            return self.client.get(object_id)[1]
+        # Get the value from the plasma object store in a single request. A missing object
+        # is returned as None immediately (timeout_ms=0) instead of raising an exception
+        buffer = self.client.get_buffers([object_id], timeout_ms=0)[0]
+        if buffer is not None:
+            return self.deserialize(buffer)
         else:
             return None
 
@@ -125,7 +332,7 @@ class PyArrowPlasmaKVStore:
         """
         # Generate an object ID
         if isinstance(keys, list):
-            object_ids = [self.gen_object_id(key) for key in keys]
+            object_ids = self.gen_object_ids(keys)
         else:
             raise TypeError("keys must be a list")
 
@@ -151,10 +358,7 @@ class PyArrowPlasmaKVStore:
     @check_connected
     def __iter__(self):
         """Iterate over all keys and values"""
-        # Get all the object IDs
-        object_ids = self.client.list()
-
-        for key, value in self.client.get(list(object_ids.keys())):
+        for key, value in self._iter_items():
             yield key, value
 
     @check_connected
@@ -173,16 +377,17 @@ class PyArrowPlasmaKVStore:
         Returns: List of keys
 
         """
-        # local keys list
-        keys = []
-
         # Get all the object IDs
-        object_ids = self.client.list()
-
-        # Get all the values
-        _ = [keys.append(k) for k, _ in self.client.get(list(object_ids.keys()))]
+        object_ids = list(self.client.list().keys())
 
-        return keys
+        # Only the metadata (key) of the objects is read, the data (value) is left untouched
+        return [
+            self._decode_key(metadata)
+            for metadata, data in self.client.get_buffers(
+                object_ids, timeout_ms=0, with_meta=True
+            )
+            if data is not None
+        ]
 
     @check_connected
     def values(self):
@@ -191,16 +396,7 @@ class PyArrowPlasmaKVStore:
         Returns: List of values
 
         """
-        # local values list
-        values = []
-
-        # Get all the object IDs
-        object_ids = self.client.list()
-
-        # Get all the values
-        _ = [values.append(v) for _, v in self.client.get(list(object_ids.keys()))]
-
-        return values
+        return [value for _, value in self._iter_items()]
 
     @check_connected
     def replace(self, key, value):
@@ -210,7 +406,7 @@ class PyArrowPlasmaKVStore:
 
         Args:
           key: Key (type: string, bytes, or int)
-          value: Value (Any python object)
+          value: Value (Any picklable python object)
 
         """
         # Generate an object ID
@@ -219,7 +415,7 @@ class PyArrowPlasmaKVStore:
         # Delete the object from the plasma object store if it exists and add the new value
         try:
             self.client.delete([object_id])
-            self.client.put([key, value], object_id)
+            self._put(object_id, key, value)
         except plasma.PlasmaStoreFull:
             raise ValueError(
                 "Plasma object store is full. Please free some memory by deleting some objects"
@@ -237,36 +433,64 @@ class PyArrowPlasmaKVStore:
         else:
             self.__delitem__([keys])
 
+    @check_connected
     def get_multi(self, keys):
         """Get multiple items from the plasma object store
 
         Args:
-          keys: List of keys (type: string, bytes, or int)
+          keys: List (or any iterable) of keys (type: string, bytes, or int)
 
         Returns: Dictionary of key-value pairs. If key is not present in the DB, \
             it is not present in the returned dictionary
 
         """
-        local_dict = {}
+        # Materialize the keys as they are iterated twice (e.g., generators)
+        keys = list(keys)
+
+        # Generate the object IDs
+        object_ids = self.gen_object_ids(keys)
 
-        for key in keys:
-            local_dict[key] = self[key]
+        # Get all the values in a single request without waiting for missing objects
+        buffers = self.client.get_buffers(object_ids, timeout_ms=0)
 
-        return local_dict
+        # Results are keyed by the original keys (as in keys() and iteration)
+        return {
+            key.key if type(key) is KeyView else key: self.deserialize(buffer)
+            for key, buffer in zip(keys, buffers)
+            if buffer is not None
+        }
 
+    @check_connected
     def set_multi(self, keys, values):
         """Set multiple items in the plasma object store
 
         Args:
-          keys: List of keys (type: string, bytes, or int). Duplicate keys will be overwritten
-          values: List of values (Any Python object).
+          keys: List of keys (type: string, bytes, or int). Existing keys are ignored
+          values: List of values (Any picklable Python object).
 
         """
         if len(keys) != len(values):
             raise ValueError("Keys and values should be of same length")
 
-        for key, value in zip(keys, values):
-            self[key] = value
+        # Generate the object IDs
+        object_ids = self.gen_object_ids(keys)
+
+        # Set the key-value pairs in the plasma object store
+        client = self.client
+        try:
+            for object_id, key, value in zip(object_ids, keys, values):
+                # Existing keys are ignored, skip serializing their values
+                if client.contains(object_id):
+                    continue
+
+                try:
+                    self._put(object_id, key, value)
+                except plasma.PlasmaObjectExists:
+                    pass
+        except plasma.PlasmaStoreFull:
+            raise ValueError(
+                "Plasma object store is full. Please free some memory by deleting some objects"
+            ) from plasma.PlasmaStoreFull
 
     def create_plasma_store(self):
         """Create the plasma object store"""
@@ -286,7 +510,8 @@ class PyArrowPlasmaKVStore:
         # terminate the plasma object store and raise a connection error
         if self.__created:
             try:
-                self.client = plasma.connect(self.socket_path)
+                # Other threads connect their own client on first use
+                self.__connect_thread()
                 self._connected = True
             except Exception as excep:
                 self.cleanup()
@@ -302,15 +527,32 @@ class PyArrowPlasmaKVStore:
     @check_connected
     def disconnect(self):
         """Disconnect from the plasma object store"""
-        # Disconnect this client from the plasma object store
+        with self._clients_lock:
+            clients = self._clients
+            self._clients = []
+            self._idle_clients = []
+            self._local = threading.local()
+            self._generation += 1
+
+        # Disconnect the clients of all the threads from the plasma object store
         try:
-            self.client.disconnect()
+            for client in clients:
+                client.disconnect()
             self._connected = False
         except Exception as excep:
             raise ConnectionError(
                 "Failed to disconnect from the plasma object store"
             ) from excep
 
+    @property
+    def client(self):
+        """Plasma client of the calling thread"""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self.__connect_thread()
+
+        return client
+
     def gen_object_id(self, key):
         """Generate an object ID
 
@@ -320,11 +562,26 @@ class PyArrowPlasmaKVStore:
         Returns: Object ID
 
         """
-        # Generate a 20 bytes hash digest of the key
-        key_digest = self.gen_hash(key)
+        if type(key) is KeyView:
+            return key.object_id
+
+        # Use the 20 bytes hash digest of the key as the object ID
+        return _gen_object_id(key)
+
+    def gen_object_ids(self, keys):
+        """Generate the object IDs of multiple keys
+
+        Args:
+          keys: List of keys
 
-        # Use the hash digest as the object ID
-        return plasma.ObjectID(key_digest)
+        Returns: List of object IDs
+
+        """
+        # Call the module level function directly, avoiding a gen_object_id method call per key
+        return [
+            key.object_id if type(key) is KeyView else _gen_object_id(key)
+            for key in keys
+        ]
 
     @check_connected
     def get_object_ids(self):
@@ -363,11 +620,10 @@ class PyArrowPlasmaKVStore:
         Returns: Amount of total used memory by the objects in the plasma object store
 
         """
-        used = 0
-        objects_list = self.client.list()
-
-        for _, metadata in objects_list.items():
-            used += metadata["data_size"] + metadata["metadata_size"]
+        used = sum(
+            metadata["data_size"] + metadata["metadata_size"]
+            for metadata in self.client.list().values()
+        )
 
         if human_readable:
             return format_size(used)
@@ -408,6 +664,222 @@ class PyArrowPlasmaKVStore:
                     to create it first"
             )
 
+    def serialize(self, value):
+        """Serialization using pickle (protocol 5) or msgspec.msgpack
+
+        Contiguous buffers of the value (e.g., NumPy arrays) are not copied into the pickle \
+            payload, they are returned as separate segments and copied only once, straight \
+            into the plasma object store. If msgpack_values is set, values supported by \
+            msgspec.msgpack are serialized using it instead of pickle. Payloads larger than \
+            compression_threshold are compressed using zstd.
+
+        Args:
+          value: Any picklable Python object to serialize
+
+        Returns: List of segments (header, payload, out-of-band buffers)
+
+        """
+        flags = 0
+        payload = None
+        buffers = []
+
+        if self.msgpack_values:
+            try:
+                payload = self.encoder.encode(value)
+                flags |= _FLAG_MSGPACK
+            except (TypeError, OverflowError):
+                # Not supported by msgpack (e.g., NumPy arrays), fall back to pickle
+                pass
+
+        if payload is None:
+            payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+
+        if (
+            self.compression_threshold is not None
+            and len(payload) > self.compression_threshold
+        ):
+            compressed = zstd.compress(payload, self.compression_level)
+            # Keep incompressible payloads as is
+            if len(compressed) < len(payload):
+                payload = compressed
+                flags |= _FLAG_ZSTD
+
+        segments = [payload] + [buffer.raw() for buffer in buffers]
+
+        # The header holds the flags and the number of segments followed by the size of
+        # each segment
+        sizes = [memoryview(segment).nbytes for segment in segments]
+        header = _HEADER.pack(flags, len(sizes))
+        header += struct.pack(f"<{len(sizes)}Q", *sizes)
+
+        return [header] + segments
+
+    def deserialize(self, buffer):
+        """Deserialization using pickle or msgspec.msgpack
+
+        Out-of-band buffers are passed to pickle as zero-copy slices of the plasma buffer, \
+            so NumPy arrays are returned as read-only views of the shared memory.
+
+        Args:
+          buffer: Plasma buffer holding the serialized segments
+
+        Returns: Deserialized object
+
+        """
+        flags, count = _HEADER.unpack_from(buffer)
+        sizes = struct.unpack_from(f"<{count}Q", buffer, _HEADER.size)
+        offsets = _segment_offsets([_HEADER.size + 8 * count, *sizes])
+        segments = [
+            buffer.slice(offset, size) for offset, size in zip(offsets[1:], sizes)
+        ]
+
+        payload = segments[0]
+        if flags & _FLAG_ZSTD:
+            payload = zstd.decompress(payload)
+
+        if flags & _FLAG_MSGPACK:
+            return self.decoder.decode(payload)
+
+        return pickle.loads(payload, buffers=segments[1:])
+
+    def _encode_key(self, key):
+        """Serialize a key for the object's metadata
+
+        Keys are serialized using msgspec.msgpack, keys not supported by msgpack (e.g., ints \
+            outside the 64 bit range) are serialized using pickle. The first byte tells \
+            which one.
+
+        Args:
+          key: Key (type: string, bytes, or int)
+
+        Returns: Serialized key
+
+        """
+        try:
+            return bytes((_KEY_MSGPACK,)) + self.encoder.encode(key)
+        except (TypeError, OverflowError):
+            return bytes((_KEY_PICKLE,)) + pickle.dumps(key, protocol=5)
+
+    def _decode_key(self, metadata):
+        """Deserialize a key from the object's metadata
+
+        Args:
+          metadata: Serialized key (see _encode_key)
+
+        Returns: Key
+
+        """
+        if metadata[0] == _KEY_PICKLE:
+            return pickle.loads(metadata[1:])
+
+        return self.decoder.decode(metadata[1:])
+
+    def _put(self, object_id, key, value):
+        """Store the serialized value as the object's data and the key as its metadata
+
+        The object is allocated with its exact size and the segments are copied directly \
+            into the shared memory, avoiding any intermediate buffer.
+
+        Args:
+          object_id: Object ID generated from the key
+          key: Key (type: string, bytes, or int)
+          value: Value (Any picklable python object)
+
+        """
+        if type(key) is KeyView:
+            key = key.key
+
+        segments = self.serialize(value)
+        sizes = [memoryview(segment).nbytes for segment in segments]
+        offsets = _segment_offsets(sizes)
+
+        client = self.client
+        buffer = client.create(
+            object_id, offsets[-1] + sizes[-1], self._encode_key(key)
+        )
+        stream = None
+        try:
+            stream = pa.FixedSizeBufferWriter(buffer)
+            # Same number of memcopy threads as plasma's put()
+            stream.set_memcopy_threads(6)
+
+            position = 0
+            for offset, size, segment in zip(offsets, sizes, segments):
+                stream.write(bytes(offset - position))
+                stream.write(segment)
+                position = offset + size
+        except BaseException:
+            # A created but unsealed object would block the key forever (contains() is False
+            # and create() raises PlasmaObjectExists). Release the buffer and delete the
+            # object, plasma only deletes sealed objects so it is sealed first
+            stream = buffer = None
+            client.seal(object_id)
+            client.delete([object_id])
+            raise
+
+        client.seal(object_id)
+
+    def _iter_items(self, chunk_size=64):
+        """Iterate over the stored key, value pairs
+
+        Objects are fetched chunk_size at a time to cap the peak memory used while \
+            iterating over large stores.
+
+        Args:
+          chunk_size: Number of objects fetched per request (default: 64)
+
+        """
+        # Get all the object IDs
+        object_ids = list(self.client.list().keys())
+
+        for start in range(0, len(object_ids), chunk_size):
+            chunk = object_ids[start : start + chunk_size]
+
+            # Objects deleted since listing are skipped instead of waiting for them
+            for metadata, data in self.client.get_buffers(
+                chunk, timeout_ms=0, with_meta=True
+            ):
+                if data is not None:
+                    yield self._decode_key(metadata), self.deserialize(data)
+
+    def __connect_thread(self):
+        """Connect a plasma client for the calling thread
+
+        An idle client of an exited thread is reused if available. When the thread exits \
+            its client is returned to the idle clients pool instead of being disconnected, \
+            as disconnecting it would let the plasma store free the shared memory backing \
+            the zero-copy values (e.g., NumPy arrays) still held by the caller.
+
+        Returns: Plasma client
+
+        """
+        with self._clients_lock:
+            local = self._local
+            idle_clients = self._idle_clients
+            generation = self._generation
+            client = idle_clients.pop() if idle_clients else None
+
+        if client is None:
+            client = plasma.connect(self.socket_path)
+            with self._clients_lock:
+                disconnected = generation != self._generation
+                if not disconnected:
+                    self._clients.append(client)
+
+            # disconnect() was called while connecting, the client would never be disconnected
+            if disconnected:
+                client.disconnect()
+                raise ConnectionError(
+                    "Plasma object store was disconnected while connecting"
+                )
+
+        local.client = client
+        weakref.finalize(
+            threading.current_thread(), _release_client, client, idle_clients
+        )
+
+        return client
+
     def __initialize_plasma_store_in_background(self):
         """Start the plasma store in the background using subprocess"""
         # Delete the socket if it already exists for new instances
@@ -419,15 +891,31 @@ class PyArrowPlasmaKVStore:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
         )
-        time.sleep(0.2)
-
-        # Check if plasma store started successfully
-        if plasma_store_process.poll() is not None:
-            raise RuntimeError(
-                f"plasma_store failed to start with return code: {plasma_store_process.returncode}"
-            )
+        # Wait until the plasma store accepts connections instead of sleeping a fixed time
+        deadline = time.monotonic() + _STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            # Check if plasma store started successfully
+            if plasma_store_process.poll() is not None:
+                raise RuntimeError(
+                    f"plasma_store failed to start with return code: {plasma_store_process.returncode}"
+                )
 
-        return plasma_store_process
+            if os.path.exists(self.socket_path):
+                # A single attempt without plasma's internal retries (each one sleeps 100 ms
+                # and logs an error), the retries are driven by this loop and _STARTUP_TIMEOUT
+                try:
+                    plasma.connect(self.socket_path, num_retries=0).disconnect()
+                    return plasma_store_process
+                except Exception:
+                    pass
+
+            time.sleep(0.002)
+
+        plasma_store_process.terminate()
+        plasma_store_process.wait()
+        raise RuntimeError(
+            f"plasma_store did not become ready within {_STARTUP_TIMEOUT} seconds"
+        )
 
     def __check_size(self, size):
         """Check if the size is valid
@@ -448,9 +936,8 @@ class PyArrowPlasmaKVStore:
         # f_bavail == Number of free blocks for unpriviledged users
         # Example: df -h /dev/shm | awk '{print $4}' (prints the available memory \
         # in the shared memory)
-        available_shm_mem = (
-            os.statvfs("/dev/shm").f_bsize * os.statvfs("/dev/shm").f_bavail
-        )
+        shm_stats = os.statvfs("/dev/shm")
+        available_shm_mem = shm_stats.f_bsize * shm_stats.f_bavail
         if size:
             if size <= available_shm_mem:
                 return int(size)
@@ -464,22 +951,16 @@ class PyArrowPlasmaKVStore:
 
     @staticmethod
     def gen_hash(key, digest_size=20):
-        """Generate the hash of a key using hashlibs BLAKE2 algorithm
+        """Generate the hash of a key using the BLAKE3 algorithm
 
-        BLAKE2 seems to be a good choice for hashing compared to SHA-256, SHA-512, SHA-3, etc.
-        BLAKE3 is still not available in hashlib and as soon as it is available we will use it.
+        BLAKE3 is faster than BLAKE2, SHA-256, SHA-512, SHA-3, etc. and is provided by the \
+            blake3 package as it is not available in hashlib.
 
         Args:
-          key: Key (string, bytes, int)
+          key: Key (string, bytes, int or their subclasses). Other types raise a TypeError
           digest_size: Size of the digest (default: 20 bytes)
 
         Returns: Hash digest of the key
 
         """
-        if isinstance(key, str):
-            hash_value = blake2b(key.encode(), digest_size=digest_size)
-        if isinstance(key, bytes):
-            hash_value = blake2b(key, digest_size=digest_size)
-        if isinstance(key, int):
-            hash_value = blake2b(str(key).encode(), digest_size=digest_size)
-        return hash_value.digest()
+        return _gen_hash(key, digest_size)
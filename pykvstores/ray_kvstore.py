@@ -3,12 +3,32 @@
 import ray
 
 
+def _fetch_values(entries):
+    """Fetch the values of the stored entries using a single ray.get
+
+    Args:
+      entries: List of (ObjectRef, index) entries. The index is None for values stored \
+          with set() and the position of the value in the batch for values stored with \
+          set_multi()
+
+    Returns: List of values
+
+    """
+    # Get every distinct object only once as a batch is shared by several entries
+    refs = list(dict.fromkeys(ref for ref, _ in entries))
+    objects = dict(zip(refs, ray.get(refs)))
+
+    return [
+        objects[ref] if index is None else objects[ref][index] for ref, index in entries
+    ]
+
+
 @ray.remote
 class RayKVActor:
     """Ray key-value store actor"""
 
     def __init__(self):
-        # Stores the keys and the ObjectRef's
+        # Stores the keys and the (ObjectRef, index) entries
         self.kvstore = {}
 
     def set(self, key, value):
@@ -19,7 +39,7 @@ class RayKVActor:
           value: The value to set
 
         """
-        self.kvstore[key] = ray.put(value)
+        self.kvstore[key] = (ray.put(value), None)
 
     def get(self, key):
         """Get an item from the Ray's plasma object store
@@ -29,10 +49,12 @@ class RayKVActor:
 
         """
         try:
-            return ray.get(self.kvstore[key])
+            entry = self.kvstore[key]
         except KeyError:
             return None
 
+        return _fetch_values([entry])[0]
+
     def len(self):
         """Return the number of items in the Ray's plasma object store"""
         return len(self.kvstore)
@@ -59,8 +81,8 @@ class RayKVActor:
             pass
 
     def iter(self):
-        """Return an iterator over the keys in the Ray's plasma object store"""
-        return self.kvstore.items()
+        """Return a list of the keys and entries in the Ray's plasma object store"""
+        return list(self.kvstore.items())
 
     def keys(self):
         """Return a list of keys in the Ray's plasma object store"""
@@ -68,7 +90,7 @@ class RayKVActor:
 
     def values(self):
         """Return a list of values in the Ray's plasma object store"""
-        return ray.get(list(self.kvstore.values()))
+        return _fetch_values(list(self.kvstore.values()))
 
     def get_multi(self, keys):
         """Return multiple items from the Ray's plasma object store
@@ -77,18 +99,24 @@ class RayKVActor:
           keys: The keys to get
 
         """
-        return [ray.get(self.kvstore[key]) for key in keys]
+        return _fetch_values([self.kvstore[key] for key in keys])
 
     def set_multi(self, keys, values):
         """Set multiple items in the Ray's plasma object store
 
+        The values are stored as a single write-once batch (one ray.put), each key refers \
+            to its position in the batch. The batch is kept in the object store as long as \
+            one of its keys is not overwritten or deleted.
+
         Args:
           keys: List of keys
           values: List of values
 
         """
-        for key, value in zip(keys, values):
-            self.kvstore[key] = ray.put(value)
+        batch = ray.put(list(values))
+
+        for index, key in enumerate(keys):
+            self.kvstore[key] = (batch, index)
 
     def getattr(self, attr):
         """Return the value of the attribute
@@ -118,6 +146,8 @@ class RayKVStore:
       2. Only one instance of the RayKVStore class can be created as the Ray cluster is \
             initialized in the constructor
       3. Do not forget to call the close() method to close the Ray cluster
+      4. set_multi() stores the values as a single write-once batch object, getting any of \
+          its keys fetches the whole batch
 
     """
 
@@ -175,8 +205,12 @@ class RayKVStore:
     def __iter__(self):
         """Return an iterator over the items in the Ray's plasma object store"""
         items = ray.get(self.actor.iter.remote())
-        for key, value in items:
-            yield key, ray.get(value)
+        if not items:
+            return
+
+        # Fetch all the values at once instead of one ray.get per item
+        keys, entries = zip(*items)
+        yield from zip(keys, _fetch_values(entries))
 
     def keys(self):
         """Return the keys in the Ray's plasma object store"""
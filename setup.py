@@ -40,6 +40,7 @@ setup(
         "zstd==1.5.1.0",
         "psutil==5.9.0",
         "humanfriendly==10.0",
+        "blake3==0.3.1",
     ],
     zip_safe=False,
 )